@@ -0,0 +1,12 @@
+"""
+Shared configuration for the Python examples.
+
+Model IDs live here so every example pins the same snapshot and a new
+one can be rolled out by changing a single line.
+"""
+
+# AWS Bedrock (global endpoint)
+BEDROCK_MODEL = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
+
+# Google Vertex AI
+VERTEX_MODEL = "claude-sonnet-4-5@20250929"
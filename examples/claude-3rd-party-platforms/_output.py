@@ -0,0 +1,100 @@
+"""
+Terminal output helper for the streaming examples.
+
+Streaming responses arrive as many small chunks. Writing each one
+directly costs one write() syscall per chunk; FlushBuffer coalesces them
+while keeping output visually smooth.
+"""
+
+import os
+import threading
+import time
+
+
+class FlushBuffer:
+    """
+    Buffer writes to a file descriptor and flush them in batches.
+
+    The buffer is flushed once it holds max_bytes, or once the oldest
+    buffered byte has waited max_ms - whichever comes first. A background
+    thread handles the time limit, so text never sits unseen for longer
+    than max_ms, even while the model pauses between chunks. Call flush()
+    when the stream ends to write out the rest immediately, and close()
+    (or use it as a context manager) to stop the background thread.
+    """
+
+    def __init__(self, fd, max_bytes=64, max_ms=16):
+        """
+        Initialize buffer.
+
+        Args:
+            fd: File descriptor to write to (e.g. sys.stdout.fileno())
+            max_bytes: Flush once this many bytes are buffered
+            max_ms: Flush once buffered bytes have waited this long
+        """
+        self.fd = fd
+        self.max_bytes = max_bytes
+        self.max_delay = max_ms / 1000
+        self._buf = bytearray()
+        self._first_write = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._timer = threading.Thread(target=self._flush_on_timer, daemon=True)
+        self._timer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, data):
+        """Buffer bytes, flushing if the size limit is reached."""
+        with self._cond:
+            if self._closed:
+                raise ValueError("write to closed FlushBuffer")
+            if not self._buf:
+                # Start the clock for this batch and wake the timer thread
+                self._first_write = time.monotonic()
+                self._cond.notify()
+            self._buf += data
+            if len(self._buf) >= self.max_bytes:
+                self._flush_locked()
+
+    def flush(self):
+        """Write out everything buffered so far."""
+        with self._cond:
+            self._flush_locked()
+
+    def close(self):
+        """Flush remaining output and stop the background thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            self._cond.notify()
+        self._timer.join()
+
+    def _flush_locked(self):
+        """Write the buffer to the fd; caller must hold the lock."""
+        data = bytes(self._buf)
+        self._buf.clear()
+
+        # os.write may write less than requested (e.g. to a full pipe)
+        while data:
+            written = os.write(self.fd, data)
+            data = data[written:]
+
+    def _flush_on_timer(self):
+        """Flush each batch once its oldest byte has waited max_delay."""
+        with self._cond:
+            while True:
+                self._cond.wait_for(lambda: self._buf or self._closed)
+                if self._closed:
+                    return
+                remaining = self._first_write + self.max_delay - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                else:
+                    self._flush_locked()
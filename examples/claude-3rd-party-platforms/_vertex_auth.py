@@ -0,0 +1,141 @@
+"""
+Google Vertex AI - Cached Access Token Helper
+
+Shared by the Vertex AI examples. Resolving application default
+credentials and fetching an OAuth token is a network round trip on every
+run, and Google recommends reusing a token until it expires. This module
+caches the token on disk and reuses it across invocations.
+
+The cached token can't be refreshed on its own, so it is only reused
+while it has at least MIN_REMAINING left - plenty for a CLI script. It is
+also tied to the credentials file it came from: switching
+GOOGLE_APPLICATION_CREDENTIALS or logging in to ADC as another account
+invalidates it.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import google.auth
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+TOKEN_CACHE = Path.home() / ".cache" / "claude-air" / "vertex_token.json"
+MIN_REMAINING = timedelta(minutes=5)
+
+
+def _utcnow():
+    """Current UTC time as a naive datetime (google-auth's convention)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _adc_path():
+    """Path of the credentials file google.auth.default() would use."""
+
+    path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+    if path:
+        return path
+
+    config_dir = os.environ.get("CLOUDSDK_CONFIG")
+    if not config_dir:
+        if os.name == "nt":
+            config_dir = os.path.join(os.environ.get("APPDATA", ""), "gcloud")
+        else:
+            config_dir = os.path.join(Path.home(), ".config", "gcloud")
+
+    return os.path.join(config_dir, "application_default_credentials.json")
+
+
+def _identity_key():
+    """
+    Fingerprint the credentials a fresh token would be issued for.
+
+    Combines the credentials file path with a hash of its contents, so a
+    different file or a re-login as another account yields a new key.
+    Only the hash is stored, never the secrets themselves.
+    """
+
+    path = _adc_path()
+    try:
+        digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        # No file, e.g. credentials from the GCE metadata server
+        digest = None
+
+    return f"{path}:{digest}"
+
+
+def _read_cached_credentials(identity):
+    """
+    Load the cached token if it matches identity and is valid long enough.
+
+    Args:
+        identity: Key from _identity_key() for the current credentials
+
+    Returns:
+        Credentials, or None if there is no usable cached token
+    """
+
+    try:
+        cached = json.loads(TOKEN_CACHE.read_text())
+        expiry = datetime.fromisoformat(cached["expiry"])
+        token = cached["token"]
+        cached_identity = cached["identity"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if cached_identity != identity:
+        return None
+
+    if expiry - _utcnow() <= MIN_REMAINING:
+        return None
+
+    return Credentials(token=token, expiry=expiry, scopes=SCOPES)
+
+
+def _write_cached_credentials(credentials, identity):
+    """Save the token, its expiry and identity, readable only by the user."""
+
+    if not credentials.token or not credentials.expiry:
+        return
+
+    try:
+        TOKEN_CACHE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "token": credentials.token,
+                    "expiry": credentials.expiry.isoformat(),
+                    "identity": identity
+                },
+                f
+            )
+    except OSError:
+        # Caching is an optimization; the token is still usable
+        pass
+
+
+def load_credentials():
+    """
+    Get Vertex AI credentials, reusing a cached access token if possible.
+
+    Returns:
+        google.auth credentials with a valid access token
+    """
+
+    identity = _identity_key()
+
+    credentials = _read_cached_credentials(identity)
+    if credentials is not None:
+        return credentials
+
+    credentials, _ = google.auth.default(scopes=SCOPES)
+    credentials.refresh(Request())
+    _write_cached_credentials(credentials, identity)
+
+    return credentials
@@ -2,8 +2,9 @@
 AWS Bedrock - Basic Claude Usage Example
 
 This example demonstrates:
-- Initializing AnthropicBedrock client
+- Initializing AsyncAnthropicBedrock client
 - Sending simple messages
+- Sending a batch of prompts concurrently
 - Handling responses
 
 Setup:
@@ -14,29 +15,63 @@ Usage:
     python bedrock_basic.py
 """
 
-from anthropic import AnthropicBedrock
+import asyncio
+from anthropic import AsyncAnthropicBedrock
+from _config import BEDROCK_MODEL
 
+# Upper bound on in-flight requests, to stay clear of rate limits
+MAX_CONCURRENCY = 16
 
-def main():
-    """Basic Bedrock usage example."""
+
+async def run_batch(prompts, max_concurrency=MAX_CONCURRENCY):
+    """
+    Send prompts to Claude concurrently.
+
+    Args:
+        prompts: List of user prompts
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        List of messages (or exceptions) in the same order as prompts
+    """
 
     # Initialize client (uses AWS credentials from environment or ~/.aws/credentials)
-    client = AnthropicBedrock(aws_region="us-west-2")
+    async with AsyncAnthropicBedrock(aws_region="us-west-2") as client:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(prompt):
+            async with semaphore:
+                return await client.messages.create(
+                    model=BEDROCK_MODEL,
+                    max_tokens=256,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                )
+
+        return await asyncio.gather(
+            *(send(prompt) for prompt in prompts),
+            return_exceptions=True
+        )
+
+
+def main():
+    """Basic Bedrock usage example."""
 
     print("🔷 AWS Bedrock - Basic Claude Usage\n")
 
-    # Send a simple message
+    # Send a simple message (a batch of one)
     print("Sending message to Claude...")
-    message = client.messages.create(
-        model="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
-        max_tokens=256,
-        messages=[
-            {
-                "role": "user",
-                "content": "What is the capital of France? Answer in one sentence."
-            }
-        ]
-    )
+    results = asyncio.run(run_batch([
+        "What is the capital of France? Answer in one sentence."
+    ]))
+    message = results[0]
+
+    if isinstance(message, BaseException):
+        raise message
 
     # Extract and print response
     response_text = message.content[0].text
@@ -5,31 +5,164 @@ This example demonstrates:
 - Maintaining conversation history
 - Multi-turn interactions
 - Context persistence across messages
+- Bounding history size with a sliding window
+- Prompt caching of the conversation prefix
+- Streaming responses as they are generated
+- Reusing warm HTTP/2 connections across turns
+- Reading input on a background thread while keeping the connection warm
+
+Note: warming the connection sends a real 1-token request, which is billed
+and counts against your rate limit. The session sends one at start-up and
+at most one more per prompt, if you stay idle for KEEPALIVE_INTERVAL.
 
 Setup:
-    pip install -U "anthropic[bedrock]"
+    pip install -U "anthropic[bedrock]" "httpx[http2]"
     aws configure
 
 Usage:
     python bedrock_conversation.py
 """
 
+import queue
+import sys
+import threading
+import time
+from collections import deque
+import httpx
 from anthropic import AnthropicBedrock
+from _config import BEDROCK_MODEL
+from _output import FlushBuffer
+
+# Cache breakpoint marker for prompt caching
+CACHE_CONTROL = {"type": "ephemeral"}
 
 
 class ChatSession:
     """Manages multi-turn conversation with Claude on Bedrock."""
 
-    def __init__(self, aws_region="us-west-2"):
+    # Maximum number of messages kept in history (system prompt is separate)
+    MAX_HISTORY = 50
+
+    # Idle connections are closed by the pool after this many seconds
+    KEEPALIVE_EXPIRY = 300.0
+
+    # Re-warm the connection after this much idle time (below the expiry);
+    # at most once per prompt, since each warm-up is a billed request
+    KEEPALIVE_INTERVAL = 240.0
+
+    def __init__(self, aws_region="us-west-2", max_history_messages=MAX_HISTORY):
         """Initialize chat session."""
-        self.client = AnthropicBedrock(aws_region=aws_region)
-        self.conversation_history = []
-        self.model = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
+        # Keep-alive pool so every turn reuses the same TLS connection
+        self.client = AnthropicBedrock(
+            aws_region=aws_region,
+            http_client=httpx.Client(
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY
+                ),
+                http2=True,
+                timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=2.0)
+            )
+        )
+        # Trimmed from the left in blocks once it reaches max_history_messages
+        self.conversation_history = deque()
+        self.max_history_messages = max_history_messages
+        self.model = BEDROCK_MODEL
         self.system_prompt = (
             "You are a helpful assistant. Be concise and clear in your responses."
         )
+        # Structured system prompt so it can be cached across turns
+        self.system = [
+            {
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": CACHE_CONTROL
+            }
+        ]
+        self.last_usage = None
+        self._last_request = time.monotonic()
+        self._rewarmed = False
+
+        # Open the connection while the user types their first message
+        threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def keep_alive(self):
+        """
+        Re-warm the connection if it has been idle long enough to drop.
+
+        Fires at most once between user messages, so an idle session
+        doesn't keep sending billed requests.
+        """
+        if self._rewarmed:
+            return
+        if time.monotonic() - self._last_request >= self.KEEPALIVE_INTERVAL:
+            self._rewarmed = True
+            threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def _warm_up(self):
+        """Establish the TCP+TLS connection with a minimal request."""
+        try:
+            self.client.messages.create(
+                model=self.model,
+                max_tokens=1,
+                messages=[{"role": "user", "content": "hi"}]
+            )
+        except Exception:
+            # Warm-up is best effort; real requests report their own errors
+            pass
 
     def chat(self, user_message):
+        """
+        Send message and stream the response, maintaining conversation history.
+
+        Args:
+            user_message: User's message
+
+        Yields:
+            Chunks of the assistant's response as they arrive
+        """
+
+        # Add user message to history
+        self.conversation_history.append({
+            "role": "user",
+            "content": user_message
+        })
+
+        # Collect chunks in a list and join once (linear, unlike str +=)
+        parts = []
+        append = parts.append
+
+        # Stream response from Claude
+        self._last_request = time.monotonic()
+        self._rewarmed = False
+        try:
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=512,
+                system=self.system,
+                messages=self._build_messages()
+            ) as stream:
+                for text in stream.text_stream:
+                    append(text)
+                    yield text
+        except (Exception, GeneratorExit):
+            # Drop the unanswered user message so a retry doesn't duplicate it
+            # (GeneratorExit covers the caller abandoning the stream early)
+            self.conversation_history.pop()
+            raise
+
+        self.last_usage = stream.get_final_message().usage
+
+        # Add assistant's response to history
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": "".join(parts)
+        })
+
+        self._trim_history()
+
+    def chat_blocking(self, user_message):
         """
         Send message and get response, maintaining conversation history.
 
@@ -47,12 +180,21 @@ class ChatSession:
         })
 
         # Get response from Claude
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=512,
-            system=self.system_prompt,
-            messages=self.conversation_history
-        )
+        self._last_request = time.monotonic()
+        self._rewarmed = False
+        try:
+            response = self.client.messages.create(
+                model=self.model,
+                max_tokens=512,
+                system=self.system,
+                messages=self._build_messages()
+            )
+        except Exception:
+            # Drop the unanswered user message so a retry doesn't duplicate it
+            self.conversation_history.pop()
+            raise
+
+        self.last_usage = response.usage
 
         # Extract assistant's response
         assistant_message = response.content[0].text
@@ -63,8 +205,60 @@ class ChatSession:
             "content": assistant_message
         })
 
+        self._trim_history()
+
         return assistant_message
 
+    def _trim_history(self):
+        """
+        Drop old messages in one block once history reaches its limit.
+
+        Cutting back to half the limit, rather than one message per turn,
+        keeps the request prefix byte-identical between trims so prompt
+        caching keeps hitting. Trimming only happens after a successful
+        reply, so a failed turn can always be undone. The window is cut at
+        a user turn, since the conversation must start with one.
+        """
+
+        history = self.conversation_history
+
+        # Leave room for the next user message within the limit
+        if len(history) < self.max_history_messages:
+            return
+
+        # Always keep at least the exchange that just completed
+        keep = max(2, self.max_history_messages // 2)
+        while len(history) > keep or (history and history[0]["role"] != "user"):
+            history.popleft()
+
+    def _build_messages(self):
+        """
+        Build the request messages with a cache breakpoint on the prefix.
+
+        The last assistant message is the stable tail of the prefix shared
+        with the next turn, so it carries the only message-level breakpoint.
+        History itself stays plain text; the breakpoint is applied to a copy
+        and therefore moves forward automatically each turn.
+        """
+
+        messages = list(self.conversation_history)
+
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i]["role"] == "assistant":
+                messages[i] = {
+                    "role": "assistant",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": messages[i]["content"],
+                            "cache_control": CACHE_CONTROL
+                        }
+                    ]
+                }
+                break
+
+        return messages
+
     def show_history(self):
         """Display conversation history."""
         print("\n📝 Conversation History:")
@@ -76,6 +270,18 @@ class ChatSession:
         print("\n" + "=" * 60)
 
 
+def read_lines(lines):
+    """
+    Read stdin line by line into a queue.
+
+    Args:
+        lines: Queue receiving each line; None marks end of input
+    """
+    for line in iter(sys.stdin.readline, ""):
+        lines.put(line)
+    lines.put(None)
+
+
 def main():
     """Run interactive conversation example."""
 
@@ -85,29 +291,63 @@ def main():
     # Initialize chat session
     session = ChatSession()
 
+    # Batched writes for streamed output (write bound locally for the loop)
+    out = FlushBuffer(sys.stdout.fileno())
+    write = out.write
+
     # Welcome message
     print("✅ Connected to Claude on Bedrock")
     print("Start chatting (type 'quit' to exit):\n")
 
-    while True:
-        # Get user input
-        user_input = input("You: ").strip()
+    # Read input on a background thread so the main thread stays free
+    lines = queue.Queue()
+    threading.Thread(target=read_lines, args=(lines,), daemon=True).start()
+
+    try:
+        while True:
+            # Get user input, keeping the connection warm while waiting
+            print("You: ", end="", flush=True)
+            while True:
+                try:
+                    line = lines.get(timeout=0.25)
+                    break
+                except queue.Empty:
+                    session.keep_alive()
+
+            if line is None:
+                print("\n👋 Goodbye!")
+                break
+
+            user_input = line.strip()
+
+            if not user_input:
+                continue
 
-        if not user_input:
-            continue
+            if user_input.lower() == "quit":
+                print("\n👋 Goodbye!")
+                break
 
-        if user_input.lower() == "quit":
-            print("\n👋 Goodbye!")
-            break
+            if user_input.lower() == "history":
+                session.show_history()
+                continue
 
-        if user_input.lower() == "history":
-            session.show_history()
-            continue
+            # Stream response
+            print("\n🤖 Claude: ", end="", flush=True)
+            try:
+                for chunk in session.chat(user_input):
+                    write(chunk.encode("utf-8"))
+            except Exception as e:
+                out.flush()
+                print(f"\n❌ Error: {e}\n")
+                continue
+            out.flush()
+            print("\n")
 
-        # Get response
-        print("\n🤖 Claude: ", end="", flush=True)
-        response = session.chat(user_input)
-        print(f"{response}\n")
+            # Cache reads show the conversation prefix being reused
+            cache_read = getattr(session.last_usage, "cache_read_input_tokens", 0)
+            print(f"📊 Cache read tokens: {cache_read or 0}\n")
+    finally:
+        out.close()
 
 
 if __name__ == "__main__":
@@ -2,25 +2,136 @@
 AWS Bedrock - Error Handling with Retries
 
 This example demonstrates:
-- Handling rate limits with exponential backoff
+- Handling rate limits with jittered exponential backoff
+- Honoring server-advertised retry delays
 - Retry strategies
 - Proper error classification
 
 Setup:
-    pip install -U "anthropic[bedrock]"
+    pip install -U "anthropic[bedrock]" "httpx[http2]"
     aws configure
 
 Usage:
     python bedrock_error_handling.py
 """
 
+import math
+import random
+import re
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import httpx
 from anthropic import AnthropicBedrock, APIError, RateLimitError
+from _config import BEDROCK_MODEL
+
+# Decorrelated jitter bounds (seconds)
+BASE_DELAY = 1.0
+MAX_DELAY = 20.0
+
+# Longest server-advertised wait we will honor (seconds)
+MAX_RETRY_AFTER = 30.0
+
+# Retry action for errors that should be retried after a delay
+BACKOFF = "backoff"
+
+# Error type or HTTP status code -> retry action
+_RETRY_ACTIONS = {
+    RateLimitError: BACKOFF,
+    429: BACKOFF,
+    500: BACKOFF,
+    503: BACKOFF,
+    529: BACKOFF,
+}
+
+# Fallback for throttling errors that only show up in the message
+_THROTTLE_RE = re.compile(r"ThrottlingException|TooManyRequests")
+
+
+def _classify(e):
+    """
+    Decide how to handle an API error.
+
+    Looks up the error type, then its status code, and only scans the
+    message text if neither is known.
+
+    Args:
+        e: API error
+
+    Returns:
+        BACKOFF to retry after a delay, or None to give up
+    """
+
+    action = (
+        _RETRY_ACTIONS.get(type(e))
+        or _RETRY_ACTIONS.get(getattr(e, "status_code", None))
+    )
+    if action is None and _THROTTLE_RE.search(str(e)):
+        action = BACKOFF
+    return action
+
+
+def _seconds_until(value):
+    """
+    Convert a header value to a wait in seconds.
+
+    Accepts delta-seconds, an HTTP date or an RFC 3339 timestamp.
+    Returns None if the value can't be parsed or isn't finite.
+    """
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_after(e):
+    """
+    Get the server-advertised wait time from the error response.
+
+    Args:
+        e: API error
+
+    Returns:
+        Seconds to wait (at most MAX_RETRY_AFTER), or None if the server
+        didn't say
+    """
+
+    response = getattr(e, "response", None)
+    if response is None:
+        return None
+
+    for header in ("retry-after", "anthropic-ratelimit-reset"):
+        value = response.headers.get(header)
+        if value is not None:
+            wait_time = _seconds_until(value)
+            if wait_time is not None:
+                return min(wait_time, MAX_RETRY_AFTER)
+
+    return None
 
 
 def call_with_retry(client, max_retries=3):
     """
-    Call Claude API with exponential backoff retry strategy.
+    Call Claude API with decorrelated-jitter backoff retry strategy.
+
+    Honors Retry-After style headers when the server provides them, so
+    workers sharing a quota don't retry in lockstep.
 
     Args:
         client: AnthropicBedrock client instance
@@ -30,12 +141,14 @@ def call_with_retry(client, max_retries=3):
         API response or raises exception after max retries
     """
 
+    prev_sleep = BASE_DELAY
+
     for attempt in range(max_retries):
         try:
             print(f"Attempt {attempt + 1}/{max_retries}...")
 
             return client.messages.create(
-                model="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+                model=BEDROCK_MODEL,
                 max_tokens=256,
                 messages=[
                     {
@@ -45,33 +158,25 @@ def call_with_retry(client, max_retries=3):
                 ]
             )
 
-        except RateLimitError as e:
-            # Handle rate limiting with exponential backoff
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # 1s, 2s, 4s
-                print(
-                    f"⚠️  Rate limited. Waiting {wait_time}s before retry..."
-                )
-                time.sleep(wait_time)
-                continue
-            else:
-                print("❌ Max retries exceeded due to rate limiting")
+        except APIError as e:
+            if _classify(e) != BACKOFF:
+                print(f"❌ API Error: {e}")
                 raise
 
-        except APIError as e:
-            # Handle other API errors
-            error_msg = str(e)
-
-            if "ThrottlingException" in error_msg:
-                # Handle throttling similar to rate limits
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"⚠️  Throttled. Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                    continue
-
-            print(f"❌ API Error: {e}")
-            raise
+            if attempt == max_retries - 1:
+                print("❌ Max retries exceeded")
+                raise
+
+            # Prefer the server's hint, otherwise use decorrelated jitter
+            wait_time = _retry_after(e)
+            if wait_time is None:
+                wait_time = min(
+                    MAX_DELAY, random.uniform(BASE_DELAY, prev_sleep * 3)
+                )
+                prev_sleep = wait_time
+
+            print(f"⚠️  Retryable error. Waiting {wait_time:.1f}s before retry...")
+            time.sleep(wait_time)
 
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
@@ -83,7 +188,19 @@ def call_with_retry(client, max_retries=3):
 def main():
     """Demonstrate error handling with retries."""
 
-    client = AnthropicBedrock(aws_region="us-west-2")
+    # Keep-alive pool so retries reuse the established TLS connection
+    client = AnthropicBedrock(
+        aws_region="us-west-2",
+        http_client=httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=300.0
+            ),
+            http2=True,
+            timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=2.0)
+        )
+    )
 
     print("🔷 AWS Bedrock - Error Handling with Retries\n")
 
@@ -14,7 +14,10 @@ Usage:
     python bedrock_streaming.py
 """
 
+import sys
 from anthropic import AnthropicBedrock
+from _config import BEDROCK_MODEL
+from _output import FlushBuffer
 
 
 def main():
@@ -28,17 +31,27 @@ def main():
     print(f"Prompt: {prompt}\n")
     print("Response (streaming):\n")
 
+    # Chunks go straight to the stdout file descriptor, bypassing print(),
+    # batched to save syscalls; flush first so earlier output isn't left
+    # behind in sys.stdout's buffer
+    sys.stdout.flush()
+    out = FlushBuffer(sys.stdout.fileno())
+
     # Stream response
     with client.messages.stream(
-        model="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+        model=BEDROCK_MODEL,
         max_tokens=256,
         messages=[
             {"role": "user", "content": prompt}
         ]
     ) as stream:
-        # Print each chunk as it arrives
-        for text in stream.text_stream:
-            print(text, end="", flush=True)
+        # Write each chunk as it arrives (write bound locally for the loop)
+        write = out.write
+        try:
+            for text in stream.text_stream:
+                write(text.encode("utf-8"))
+        finally:
+            out.close()
 
     # Get final message for token counts
     final_message = stream.get_final_message()
@@ -3,30 +3,81 @@ AWS Bedrock - Vision/Image Processing Example
 
 This example demonstrates:
 - Sending images to Claude
-- Base64 encoding
+- Base64 encoding (several images concurrently)
 - Vision understanding capabilities
 
 Setup:
     pip install -U "anthropic[bedrock]"
+    pip install pybase64  # optional, faster encoding
     aws configure
 
 Usage:
-    python bedrock_vision.py <path_to_image>
+    python bedrock_vision.py <path_to_image> [<path_to_image> ...]
 
 Example:
     python bedrock_vision.py /path/to/image.png
+    python bedrock_vision.py before.png after.png
 """
 
-import base64
+import mmap
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from anthropic import AnthropicBedrock
+from _config import BEDROCK_MODEL
+
+# Optional SIMD-accelerated encoder (pip install pybase64), same API as base64
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+# Supported image extensions and their media types
+_MEDIA_TYPES = MappingProxyType({
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp"
+})
+
+# Upper bound on images read and encoded in parallel
+MAX_WORKERS = 8
+
+# Read size for encoding; a multiple of 3 so chunks encode without padding
+CHUNK_SIZE = 57 * 1024
+
+
+def sniff_media_type(header):
+    """
+    Detect image media type from the file's leading bytes.
+
+    Args:
+        header: First bytes of the file (at least 12)
+
+    Returns:
+        Media type, or None if the format isn't recognized
+    """
+
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if header.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
 
 
 def encode_image(image_path):
     """
     Encode image file to base64.
 
+    The media type is detected from the file contents, falling back to
+    the extension if the format isn't recognized.
+
     Args:
         image_path: Path to image file
 
@@ -34,82 +85,125 @@ def encode_image(image_path):
         Tuple of (base64_data, media_type)
     """
 
-    path = Path(image_path)
+    # Open directly rather than checking existence first (one syscall, no race)
+    try:
+        f = open(image_path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Image file not found: {image_path}") from None
+    except OSError as e:
+        # e.g. a directory or a file we aren't allowed to read
+        raise OSError(f"Can't read image file {image_path}: {e.strerror}") from None
+
+    # Map the file and encode it in chunks; pages are read in as they're used
+    encoded = bytearray()
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise ValueError(f"Image file is empty: {image_path}") from None
+        except OSError as e:
+            raise OSError(f"Can't map image file {image_path}: {e.strerror}") from None
+
+        with mm, memoryview(mm) as view:
+            # Determine media type from magic bytes, then from extension
+            media_type = sniff_media_type(bytes(view[:16]))
+            if media_type is None:
+                extension = Path(image_path).suffix.lower()
+                media_type = _MEDIA_TYPES.get(extension)
+                if media_type is None:
+                    raise ValueError(f"Unsupported image type: {extension}")
+
+            for offset in range(0, len(view), CHUNK_SIZE):
+                encoded += _b64.b64encode(
+                    view[offset:offset + CHUNK_SIZE]
+                )
+
+    image_data = encoded.decode("ascii")
 
-    if not path.exists():
-        raise FileNotFoundError(f"Image file not found: {image_path}")
+    return image_data, media_type
 
-    # Determine media type from extension
-    extension = path.suffix.lower()
-    media_types = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".gif": "image/gif",
-        ".webp": "image/webp"
-    }
 
-    if extension not in media_types:
-        raise ValueError(f"Unsupported image type: {extension}")
+def encode_images(image_paths):
+    """
+    Encode several image files to base64 concurrently.
 
-    media_type = media_types[extension]
+    File reads and encoding overlap across worker threads.
 
-    # Read and encode image
-    with open(image_path, "rb") as f:
-        image_data = base64.standard_b64encode(f.read()).decode("utf-8")
+    Args:
+        image_paths: List of paths to image files
 
-    return image_data, media_type
+    Returns:
+        List of (base64_data, media_type) tuples, in the same order
+    """
+
+    if not image_paths:
+        return []
+
+    if len(image_paths) == 1:
+        return [encode_image(image_paths[0])]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(image_paths))) as ex:
+        return list(ex.map(encode_image, image_paths))
 
 
 def main():
     """Process image with Claude vision."""
 
     if len(sys.argv) < 2:
-        print("Usage: python bedrock_vision.py <path_to_image>")
+        print("Usage: python bedrock_vision.py <path_to_image> [<path_to_image> ...]")
         print("\nExample: python bedrock_vision.py /path/to/image.png")
         sys.exit(1)
 
-    image_path = sys.argv[1]
+    image_paths = sys.argv[1:]
 
     print("🔷 AWS Bedrock - Vision/Image Processing\n")
 
-    # Encode image
-    print(f"Loading image: {image_path}")
+    # Encode images
+    for image_path in image_paths:
+        print(f"Loading image: {image_path}")
     try:
-        image_data, media_type = encode_image(image_path)
-    except (FileNotFoundError, ValueError) as e:
+        images = encode_images(image_paths)
+    except (OSError, ValueError) as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
 
+    # Build content: all images followed by the text prompt
+    content = [
+        {
+            "type": "image",
+            "source": {
+                "type": "base64",
+                "media_type": media_type,
+                "data": image_data
+            }
+        }
+        for image_data, media_type in images
+    ]
+    if len(images) == 1:
+        prompt = (
+            "Describe this image in detail. "
+            "What do you see? What are the main elements?"
+        )
+    else:
+        prompt = (
+            "Describe these images in detail. "
+            "What do you see in each? What are the main elements?"
+        )
+    content.append({"type": "text", "text": prompt})
+
     # Initialize client
     client = AnthropicBedrock(aws_region="us-west-2")
 
-    # Send image to Claude
-    print("Analyzing image with Claude...\n")
+    # Send images to Claude
+    print("Analyzing with Claude...\n")
 
     response = client.messages.create(
-        model="global.anthropic.claude-sonnet-4-5-20250929-v1:0",
+        model=BEDROCK_MODEL,
         max_tokens=512,
         messages=[
             {
                 "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": media_type,
-                            "data": image_data
-                        }
-                    },
-                    {
-                        "type": "text",
-                        "text": (
-                            "Describe this image in detail. "
-                            "What do you see? What are the main elements?"
-                        )
-                    }
-                ]
+                "content": content
             }
         ]
     )
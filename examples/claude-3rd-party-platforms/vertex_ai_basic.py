@@ -2,8 +2,10 @@
 Google Vertex AI - Basic Claude Usage Example
 
 This example demonstrates:
-- Initializing AnthropicVertex client
+- Initializing AsyncAnthropicVertex client
+- Reusing a cached access token across runs
 - Sending simple messages
+- Sending a batch of prompts concurrently
 - Handling responses
 
 Setup:
@@ -14,33 +16,69 @@ Usage:
     python vertex_ai_basic.py
 """
 
-from anthropic import AnthropicVertex
+import asyncio
+from anthropic import AsyncAnthropicVertex
+from _config import VERTEX_MODEL
+from _vertex_auth import load_credentials
 
+# Upper bound on in-flight requests, to stay clear of rate limits
+MAX_CONCURRENCY = 16
 
-def main():
-    """Basic Vertex AI usage example."""
 
-    # Initialize client (uses GCP credentials from environment)
+async def run_batch(prompts, max_concurrency=MAX_CONCURRENCY):
+    """
+    Send prompts to Claude concurrently.
+
+    Args:
+        prompts: List of user prompts
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        List of messages (or exceptions) in the same order as prompts
+    """
+
+    # Initialize client (uses GCP credentials from environment, token cached)
     # Set YOUR_PROJECT_ID to your actual GCP project
-    client = AnthropicVertex(
+    async with AsyncAnthropicVertex(
         project_id="YOUR_PROJECT_ID",  # Replace with your GCP project ID
-        region="global"  # or "us-east1", "europe-west1", etc.
-    )
+        region="global",  # or "us-east1", "europe-west1", etc.
+        credentials=load_credentials()
+    ) as client:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(prompt):
+            async with semaphore:
+                return await client.messages.create(
+                    model=VERTEX_MODEL,
+                    max_tokens=256,
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ]
+                )
+
+        return await asyncio.gather(
+            *(send(prompt) for prompt in prompts),
+            return_exceptions=True
+        )
+
+
+def main():
+    """Basic Vertex AI usage example."""
 
     print("🔵 Google Vertex AI - Basic Claude Usage\n")
 
-    # Send a simple message
+    # Send a simple message (a batch of one)
     print("Sending message to Claude...")
-    message = client.messages.create(
-        model="claude-sonnet-4-5@20250929",
-        max_tokens=256,
-        messages=[
-            {
-                "role": "user",
-                "content": "What is the capital of Japan? Answer in one sentence."
-            }
-        ]
-    )
+    results = asyncio.run(run_batch([
+        "What is the capital of Japan? Answer in one sentence."
+    ]))
+    message = results[0]
+
+    if isinstance(message, BaseException):
+        raise message
 
     # Extract and print response
     response_text = message.content[0].text
@@ -5,6 +5,7 @@ This example demonstrates:
 - Using streaming for real-time responses
 - Token counting with streaming
 - Better user experience with immediate feedback
+- Reusing a cached access token across runs
 
 Setup:
     pip install -U google-cloud-aiplatform "anthropic[vertex]"
@@ -14,15 +15,21 @@ Usage:
     python vertex_ai_streaming.py
 """
 
+import sys
 from anthropic import AnthropicVertex
+from _config import VERTEX_MODEL
+from _output import FlushBuffer
+from _vertex_auth import load_credentials
 
 
 def main():
     """Vertex AI streaming example."""
 
+    # Reuse the cached access token instead of fetching one every run
     client = AnthropicVertex(
         project_id="YOUR_PROJECT_ID",  # Replace with your GCP project ID
-        region="global"
+        region="global",
+        credentials=load_credentials()
     )
 
     print("🔵 Google Vertex AI - Streaming Response\n")
@@ -31,17 +38,27 @@ def main():
     print(f"Prompt: {prompt}\n")
     print("Response (streaming):\n")
 
+    # Chunks go straight to the stdout file descriptor, bypassing print(),
+    # batched to save syscalls; flush first so earlier output isn't left
+    # behind in sys.stdout's buffer
+    sys.stdout.flush()
+    out = FlushBuffer(sys.stdout.fileno())
+
     # Stream response
     with client.messages.stream(
-        model="claude-sonnet-4-5@20250929",
+        model=VERTEX_MODEL,
         max_tokens=256,
         messages=[
             {"role": "user", "content": prompt}
         ]
     ) as stream:
-        # Print each chunk as it arrives
-        for text in stream.text_stream:
-            print(text, end="", flush=True)
+        # Write each chunk as it arrives (write bound locally for the loop)
+        write = out.write
+        try:
+            for text in stream.text_stream:
+                write(text.encode("utf-8"))
+        finally:
+            out.close()
 
     # Get final message for token counts
     final_message = stream.get_final_message()